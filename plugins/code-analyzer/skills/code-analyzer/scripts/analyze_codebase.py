@@ -12,12 +12,19 @@ Can be used as:
 
 import sys
 import os
-import subprocess
-import argparse
-
-# Add config manager to path
-sys.path.append(os.path.dirname(__file__))
-from config_manager import ConfigManager
+import codecs
+import functools
+import io
+import re
+import shlex
+import time
+import types
+
+try:
+    from .config_manager import get_preferred_tool
+except ImportError:
+    # Executed directly as a script: its directory is already on sys.path
+    from config_manager import get_preferred_tool
 
 # Shared analysis prompts dictionary
 ANALYSIS_PROMPTS = {
@@ -61,6 +68,78 @@ ANALYSIS_PROMPTS = {
     }
 }
 
+# Intern prompt bodies so every command built from them shares one copy,
+# and freeze the table since it is shared by every lookup
+ANALYSIS_PROMPTS = types.MappingProxyType({
+    scenario: types.MappingProxyType({target: sys.intern(prompt) for target, prompt in prompts.items()})
+    for scenario, prompts in ANALYSIS_PROMPTS.items()
+})
+
+# Flattened view of ANALYSIS_PROMPTS for single-lookup prompt resolution
+_FLAT_PROMPTS = {
+    (scenario, target): prompt
+    for scenario, prompts in ANALYSIS_PROMPTS.items()
+    for target, prompt in prompts.items()
+}
+_VALID_SCENARIOS = frozenset(ANALYSIS_PROMPTS)
+
+# Command arguments preceding the prompt, one entry per tool
+_TOOL_ARGS = {
+    "gemini": ("geminicli", "--all-files", "--yolo", "-p"),
+    "qwen": ("qwen", "--all-files", "--yolo", "-p"),
+}
+_AUTO_ARGS = ("code-analyzer", "--all-files", "--comprehensive", "-p")
+
+# Display command templates with the constant arguments quoted once up front
+_COMMAND_TEMPLATES = {tool: shlex.join(args) + " %s" for tool, args in _TOOL_ARGS.items()}
+_AUTO_TEMPLATE = shlex.join(_AUTO_ARGS) + " %s"
+
+# Lowercased stderr patterns that indicate a transient, retryable failure;
+# HTTP status codes must stand alone so counts like "14290 files" don't match
+_TRANSIENT_ERROR_RE = re.compile(
+    r'timed out'
+    r'|timeout'
+    r'|econnreset'
+    r'|connection reset'
+    r'|rate limit'
+    r'|too many requests'
+    r'|temporarily unavailable'
+    r'|\b(?:429|503)\b'
+)
+
+# Separator lines the tool is asked to emit between batched results
+_RESULT_MARKER_RE = re.compile(r'^[ \t]*---RESULT (\d+)---[ \t]*$', re.MULTILINE)
+
+# Headers and markers that make a line worth keeping in the summary
+_SUMMARY_RE = re.compile(r'^#|Summary|Key|Important|##')
+
+def _prompt_for(analysis_scenario, target=None):
+    """
+    Resolve the analysis prompt for a scenario/target pair.
+    """
+    return _FLAT_PROMPTS.get((analysis_scenario, target)) or _default_prompt(analysis_scenario)
+
+@functools.lru_cache(maxsize=64)
+def _default_prompt(analysis_scenario):
+    """
+    Generic prompt for scenarios or targets without a dedicated entry.
+    """
+    if analysis_scenario in _VALID_SCENARIOS:
+        return sys.intern(f"Perform {analysis_scenario} analysis on this codebase. Provide comprehensive insights and identify key patterns.")
+    return sys.intern(f"Analyze this codebase focusing on {analysis_scenario}. Provide comprehensive insights and identify key patterns.")
+
+def _build_prompt(analysis_scenario, target=None, context=None):
+    """
+    Build the full prompt for a scenario/target pair, with optional context.
+    """
+    prompt = _prompt_for(analysis_scenario, target)
+
+    # Add context if provided
+    if context:
+        prompt = f"{prompt} Context: {context}"
+
+    return prompt
+
 def get_analysis_command(analysis_scenario, target=None, context=None):
     """
     Generate code analysis commands for different analysis scenarios.
@@ -75,62 +154,59 @@ def get_analysis_command(analysis_scenario, target=None, context=None):
         Analysis command string
     """
 
-    # Get the analysis prompt
-    if analysis_scenario in ANALYSIS_PROMPTS:
-        if target and target in ANALYSIS_PROMPTS[analysis_scenario]:
-            prompt = ANALYSIS_PROMPTS[analysis_scenario][target]
-        else:
-            prompt = f"Perform {analysis_scenario} analysis on this codebase. Provide comprehensive insights and identify key patterns."
-    else:
-        prompt = f"Analyze this codebase focusing on {analysis_scenario}. Provide comprehensive insights and identify key patterns."
+    return _get_analysis_command_for_tool(analysis_scenario, target, get_preferred_tool(), context)
 
-    # Add context if provided
-    if context:
-        prompt = f"{prompt} Context: {context}"
+def get_analysis_argv(analysis_scenario, target=None, context=None):
+    """
+    Generate the argument list for executing analysis with the configured tool.
+
+    Unlike get_analysis_command, the result is meant to be run without a shell,
+    so the prompt is passed through verbatim and needs no quoting.
 
-    # Get configured tool
-    config = ConfigManager()
-    preferred_tool = config.get_preferred_tool()
+    Args:
+        analysis_scenario: Analysis scenario (patterns, architecture, quality, review, audit)
+        target: Specific target for analysis (optional)
+        context: Additional context for the analysis (optional)
 
-    # Tool-specific command construction
-    if preferred_tool == "gemini":
-        return f"geminicli --all-files --yolo -p \"{prompt}\""
-    else:  # qwen (default)
-        return f"qwen --all-files --yolo -p \"{prompt}\""
+    Returns:
+        list: Command arguments
+    """
+    prompt = _build_prompt(analysis_scenario, target, context)
+    return _tool_argv(get_preferred_tool(), prompt)
 
 def get_tool_specific_commands(analysis_scenario, target=None):
     """
     Get analysis commands for all supported tools.
     """
-    # Force specific tools for comparison
+    # Resolve the prompt once and force specific tools for comparison
+    prompt = _prompt_for(analysis_scenario, target)
     return {
-        "gemini": _get_analysis_command_for_tool(analysis_scenario, target, "gemini"),
-        "qwen": _get_analysis_command_for_tool(analysis_scenario, target, "qwen"),
-        "configured": get_analysis_command(analysis_scenario, target)
+        "gemini": _tool_cmd("gemini", prompt),
+        "qwen": _tool_cmd("qwen", prompt),
+        "configured": _tool_cmd(get_preferred_tool(), prompt)
     }
 
-def _get_analysis_command_for_tool(analysis_scenario, target=None, tool="auto"):
+def _tool_argv(tool, prompt):
     """
-    Generate command for specific tool (for comparison purposes).
+    Build the argument list that runs a prompt with a specific tool.
     """
-    # Get the analysis prompt using shared dictionary
-    if analysis_scenario in ANALYSIS_PROMPTS:
-        if target and target in ANALYSIS_PROMPTS[analysis_scenario]:
-            prompt = ANALYSIS_PROMPTS[analysis_scenario][target]
-        else:
-            prompt = f"Perform {analysis_scenario} analysis on this codebase. Provide comprehensive insights and identify key patterns."
-    else:
-        prompt = f"Analyze this codebase focusing on {analysis_scenario}. Provide comprehensive insights and identify key patterns."
+    return [*_TOOL_ARGS.get(tool, _AUTO_ARGS), prompt]
 
-    # Tool-specific command construction
-    if tool == "gemini":
-        return f"geminicli --all-files --yolo -p \"{prompt}\""
-    elif tool == "qwen":
-        return f"qwen --all-files --yolo -p \"{prompt}\""
-    else:
-        return f"code-analyzer --all-files --comprehensive -p \"{prompt}\""
+def _tool_cmd(tool, prompt):
+    """
+    Build the shell-quoted command string that runs a prompt with a specific tool.
+    """
+    return _COMMAND_TEMPLATES.get(tool, _AUTO_TEMPLATE) % shlex.quote(prompt)
+
+@functools.lru_cache(maxsize=256)
+def _get_analysis_command_for_tool(analysis_scenario, target=None, tool="auto", context=None):
+    """
+    Generate command for specific tool (for comparison purposes).
+    """
+    prompt = _build_prompt(analysis_scenario, target, context)
+    return _tool_cmd(tool, prompt)
 
-def execute_analysis(analysis_scenario, target=None, context=None, timeout=300):
+def execute_analysis(analysis_scenario, target=None, context=None, timeout=300, stream=False):
     """
     Execute code analysis using configured CLI tool.
 
@@ -139,31 +215,101 @@ def execute_analysis(analysis_scenario, target=None, context=None, timeout=300):
         target: Specific target for analysis (optional)
         context: Additional context for the analysis (optional)
         timeout: Command timeout in seconds (default: 300)
+        stream: Echo the tool's output live while capturing it (default: False)
+
+    Returns:
+        dict: Execution result with stdout, stderr, and returncode
+    """
+    return _execute_argv(get_analysis_argv(analysis_scenario, target, context), timeout, stream)
+
+def execute_analysis_batch(requests, timeout=600):
+    """
+    Execute several analyses with a single invocation of the configured tool.
+
+    The prompts are combined into one, and the tool is asked to prefix each
+    answer with a result marker so the output can be split back up.
+
+    Args:
+        requests: List of (analysis_scenario, target, context) tuples
+        timeout: Command timeout in seconds for the whole batch (default: 600)
+
+    Returns:
+        list: One execution result per request, in the same shape as execute_analysis
+    """
+    if not requests:
+        return []
+
+    prompt = (
+        f"Complete each of the following {len(requests)} analysis tasks independently. "
+        "Begin the answer to each task with a line containing only ---RESULT N---, "
+        "where N is the task number."
+    )
+    for i, (analysis_scenario, target, context) in enumerate(requests, 1):
+        prompt += f"\n\n---TASK {i}---\n{_build_prompt(analysis_scenario, target, context)}"
+
+    result = _execute_argv(_tool_argv(get_preferred_tool(), prompt), timeout)
+    if not result["success"]:
+        return [dict(result) for _ in requests]
+
+    # Split the combined output on the result markers
+    sections = {}
+    parts = _RESULT_MARKER_RE.split(result["stdout"])
+    for number, body in zip(parts[1::2], parts[2::2]):
+        sections[int(number)] = body.strip()
+
+    results = []
+    for i in range(1, len(requests) + 1):
+        if i in sections:
+            results.append({
+                "success": True,
+                "returncode": result["returncode"],
+                "stdout": sections[i],
+                "stderr": result["stderr"],
+                "command": result["command"]
+            })
+        else:
+            results.append({
+                "success": False,
+                "returncode": result["returncode"],
+                "stdout": "",
+                "stderr": f"No result for task {i} in batch output",
+                "command": result["command"]
+            })
+    return results
+
+def _execute_argv(argv, timeout, stream=False):
+    """
+    Execute an analysis argv, capturing its output.
 
     Returns:
         dict: Execution result with stdout, stderr, and returncode
     """
+    import subprocess
+
+    command = shlex.join(argv)
+
+    print(f"Executing analysis command: {command}")
+    print("This may take several minutes...")
+
     try:
-        # Get the analysis command
-        command = get_analysis_command(analysis_scenario, target, context)
-
-        print(f"Executing analysis command: {command}")
-        print("This may take several minutes...")
-
-        # Execute the command
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
+        # Execute the command directly, without an intermediate shell
+        if stream:
+            returncode, stdout, stderr = _run_streaming(argv, timeout)
+        else:
+            result = subprocess.run(
+                argv,
+                shell=False,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+            returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
 
         return {
-            "success": result.returncode == 0,
-            "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "success": returncode == 0,
+            "returncode": returncode,
+            "stdout": stdout,
+            "stderr": stderr,
             "command": command
         }
 
@@ -184,64 +330,255 @@ def execute_analysis(analysis_scenario, target=None, context=None, timeout=300):
             "command": command
         }
 
-def execute_analysis_optimized(analysis_scenario, target=None, context=None, timeout=300):
+def _tee(source, sink, buffer):
     """
-    Optimized execution that returns summary + file path instead of full output.
+    Copy lines from a child pipe to a live sink and a capture buffer.
+
+    Never stops early: if echoing fails the pipe is still drained, so the
+    child cannot block on a full pipe.
+    """
+    try:
+        for line in source:
+            buffer.write(line)
+            try:
+                sink.write(line)
+                sink.flush()
+            except Exception:
+                pass
+    except Exception:
+        # Keep draining raw bytes so the child is never left blocked on writes
+        try:
+            for _ in iter(lambda: source.buffer.read(1 << 16), b''):
+                pass
+        except Exception:
+            pass
+    finally:
+        source.close()
+
+def _run_streaming(argv, timeout):
+    """
+    Run an analysis command, echoing its output live while capturing it.
+
+    Returns:
+        tuple: (returncode, stdout, stderr)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command does not finish in time
+    """
+    import subprocess
+    import threading
+
+    proc = subprocess.Popen(
+        argv,
+        shell=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=1,
+        encoding='utf-8',
+        errors='replace',
+        start_new_session=True
+    )
+    stdout_buf, stderr_buf = io.StringIO(), io.StringIO()
+    readers = [
+        threading.Thread(target=_tee, args=(proc.stdout, sys.stdout, stdout_buf), daemon=True),
+        threading.Thread(target=_tee, args=(proc.stderr, sys.stderr, stderr_buf), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        proc.wait(timeout=timeout)
+    except BaseException:
+        # Timeout or interrupt: take down the tool and anything it spawned
+        _kill_process_group(proc)
+        raise
+    finally:
+        # Bounded, in case a descendant escaped the group and holds a pipe open
+        for reader in readers:
+            reader.join(timeout=5)
+
+    return proc.returncode, stdout_buf.getvalue(), stderr_buf.getvalue()
+
+def _run_subprocess(argv, timeout, stdout):
+    """
+    Run an analysis command once, without an intermediate shell.
 
     Args:
-        analysis_scenario: Analysis scenario (patterns, architecture, quality, review, audit)
-        target: Specific target for analysis (optional)
-        context: Additional context for the analysis (optional)
-        timeout: Command timeout in seconds (default: 300)
+        argv: Command arguments
+        timeout: Command timeout in seconds
+        stdout: File object receiving the command's standard output
 
     Returns:
-        dict: Optimized execution result with summary, file path, and metadata
+        tuple: (returncode, stderr bytes); returncode is -1 if the command
+        timed out or could not be started
     """
-    import time
+    import subprocess
 
-    # Execute the analysis
-    result = execute_analysis(analysis_scenario, target, context, timeout)
+    try:
+        # Own session, so a timeout can take down anything the tool spawned
+        proc = subprocess.Popen(
+            argv,
+            shell=False,
+            stdout=stdout,
+            stderr=subprocess.PIPE,
+            start_new_session=True
+        )
+    except Exception as e:
+        return -1, f"Execution failed: {str(e)}".encode('utf-8')
 
-    if not result["success"]:
-        return result
+    try:
+        _, stderr = proc.communicate(timeout=timeout)
+        return proc.returncode, stderr
+    except subprocess.TimeoutExpired:
+        _kill_process_group(proc)
+        proc.stderr.close()
+        return -1, f"Command timed out after {timeout} seconds".encode('utf-8')
+    except BaseException:
+        _kill_process_group(proc)
+        raise
+
+def _kill_process_group(proc):
+    """
+    Kill a child started with start_new_session=True, along with its descendants.
 
-    # Save full output to temporary file
-    timestamp = int(time.time())
-    output_file = f"/tmp/code-analysis-{timestamp}.txt"
+    Orphaned grandchildren would otherwise keep writing to inherited
+    descriptors (the transcript file, or pipes we are draining).
+    """
+    import signal
 
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(f"Command: {result['command']}\n")
-            f.write(f"Timestamp: {time.ctime()}\n")
-            f.write("=" * 80 + "\n\n")
-            f.write(result["stdout"])
-            if result["stderr"]:
-                f.write("\n\n" + "=" * 80 + "\n")
-                f.write("STDERR:\n")
-                f.write(result["stderr"])
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+    proc.wait()
+
+def _is_retryable(result):
+    """
+    Decide whether a failed analysis result is worth retrying.
+
+    Argument/usage errors and missing executables fail the same way every time,
+    so only failures whose stderr looks transient are retried.
+    """
+    stderr = result.get("stderr", "").lower()
+    if result.get("returncode") in (1, 2) and ("usage" in stderr or "argument" in stderr):
+        return False
+    return _TRANSIENT_ERROR_RE.search(stderr) is not None
+
+def _retry_delay(attempt):
+    """
+    Exponential backoff with jitter, capped at 30 seconds.
+    """
+    import random
+
+    return min(30, 2 ** attempt + random.random())
+
+def _execute_to_file(analysis_scenario, target, context, timeout, max_retries):
+    """
+    Run analysis into a transcript file and summarize it.
+
+    Only the subprocess is retried: each attempt rewrites the transcript body
+    in place, and the summary is extracted once from the final output.
+
+    Returns:
+        dict: Optimized execution result with summary, file path, and metadata
+    """
+    import tempfile
+
+    argv = get_analysis_argv(analysis_scenario, target, context)
+    command = shlex.join(argv)
+
+    print(f"Executing analysis command: {command}")
+    print("This may take several minutes...")
+
+    output_file = None
+    try:
+        # Stream full output straight into a uniquely named temporary file
+        fd, output_file = tempfile.mkstemp(prefix='code-analysis-', suffix='.txt')
+
+        # Unbuffered, so our file offset always matches what the child wrote
+        with os.fdopen(fd, 'wb+', buffering=0) as f:
+            f.write((
+                f"Command: {command}\n"
+                f"Timestamp: {time.ctime()}\n"
+                + "=" * 80 + "\n\n"
+            ).encode('utf-8'))
+            body_start = f.tell()
+
+            for attempt in range(max_retries + 1):
+                f.seek(body_start)
+                f.truncate()
+                returncode, stderr = _run_subprocess(argv, timeout, f)
+                if returncode == 0:
+                    break
+
+                failure = {
+                    "success": False,
+                    "returncode": returncode,
+                    "stderr": stderr.decode('utf-8', 'replace'),
+                    "command": command
+                }
+                if attempt == max_retries or not _is_retryable(failure):
+                    # Only read the output back once we know it will be returned
+                    f.seek(body_start)
+                    failure["stdout"] = f.read().decode('utf-8', 'replace')
+                    break
+                print(f"Analysis failed, retrying... (Attempt {attempt + 1}/{max_retries})")
+                time.sleep(_retry_delay(attempt))
+
+            if returncode == 0:
+                # Only the head is needed for the summary; count the rest in chunks
+                f.seek(body_start)
+                head = f.read(8192)
+                total_lines = head.count(b'\n') + 1
+                if len(head) == 8192:
+                    # Small outputs fit in the head read; only scan further for larger ones
+                    for chunk in iter(lambda: f.read(1 << 16), b''):
+                        total_lines += chunk.count(b'\n')
+                    # Keep whole lines only, so no multibyte character is cut in half
+                    cut = head.rfind(b'\n')
+                    if cut != -1:
+                        head = head[:cut]
+                    head = codecs.getincrementaldecoder('utf-8')('replace').decode(head)
+                else:
+                    head = head.decode('utf-8', 'replace')
+
+                # stderr is copied as raw bytes; no decode/encode round trip
+                if stderr:
+                    f.write(("\n\n" + "=" * 80 + "\n").encode('utf-8'))
+                    f.write(b"STDERR:\n")
+                    f.write(stderr)
+
     except Exception as e:
+        if output_file and os.path.exists(output_file):
+            os.remove(output_file)
         return {
             "success": False,
             "returncode": -1,
             "stdout": "",
             "stderr": f"Failed to save output file: {str(e)}",
-            "command": result["command"]
+            "command": command
         }
 
+    if returncode != 0:
+        os.remove(output_file)
+        if attempt > 0:
+            failure["stderr"] = f"Analysis failed after {attempt} retr{'ies' if attempt > 1 else 'y'}: {failure['stderr']}"
+        return failure
+
     # Extract summary (first 30 lines or ~500 tokens)
-    lines = result["stdout"].split('\n')
+    lines = head.split('\n', 50)[:50]
     summary_lines = []
+    append = summary_lines.append
+    search = _SUMMARY_RE.search
 
     # Smart extraction of key content
-    for i, line in enumerate(lines[:50]):  # Look at first 50 lines
-        # Keep headers, summaries, and important markers
-        if (line.startswith('#') or
-            'Summary' in line or
-            'Key' in line or
-            'Important' in line or
-            '##' in line or
-            i < 5):  # Always keep first 5 lines
-            summary_lines.append(line)
+    for i, line in enumerate(lines):  # Look at first 50 lines
+        # Keep headers, summaries, and important markers; always keep first 5 lines
+        if i < 5 or search(line):
+            append(line)
             if len(summary_lines) >= 30:
                 break
 
@@ -252,14 +589,32 @@ def execute_analysis_optimized(analysis_scenario, target=None, context=None, tim
         summary_lines.extend(lines[:20])
         summary = '\n'.join(summary_lines[:30])
 
-    return {
+    result = {
         "success": True,
         "summary": summary,  # Only return summary
         "full_output_path": output_file,  # Full output file path
-        "total_lines": len(lines),
-        "command": result["command"],
-        "returncode": result["returncode"]
+        "total_lines": total_lines,
+        "command": command,
+        "returncode": returncode
     }
+    if attempt > 0:
+        result["retry_info"] = f"Succeeded after {attempt} retry{'s' if attempt > 1 else ''}"
+    return result
+
+def execute_analysis_optimized(analysis_scenario, target=None, context=None, timeout=300):
+    """
+    Optimized execution that returns summary + file path instead of full output.
+
+    Args:
+        analysis_scenario: Analysis scenario (patterns, architecture, quality, review, audit)
+        target: Specific target for analysis (optional)
+        context: Additional context for the analysis (optional)
+        timeout: Command timeout in seconds (default: 300)
+
+    Returns:
+        dict: Optimized execution result with summary, file path, and metadata
+    """
+    return _execute_to_file(analysis_scenario, target, context, timeout, max_retries=0)
 
 def execute_analysis_with_retry(analysis_scenario, target=None, context=None, timeout=300, max_retries=2):
     """
@@ -275,44 +630,13 @@ def execute_analysis_with_retry(analysis_scenario, target=None, context=None, ti
     Returns:
         dict: Execution result with retry information
     """
-    import time
-
-    for attempt in range(max_retries + 1):
-        try:
-            result = execute_analysis_optimized(analysis_scenario, target, context, timeout)
+    return _execute_to_file(analysis_scenario, target, context, timeout, max_retries)
 
-            if result["success"]:
-                if attempt > 0:
-                    result["retry_info"] = f"Succeeded after {attempt} retry{'s' if attempt > 1 else ''}"
-                return result
-            elif attempt < max_retries:
-                print(f"Analysis failed, retrying... (Attempt {attempt + 1}/{max_retries})")
-                time.sleep(2)  # Wait 2 seconds before retry
-        except Exception as e:
-            if attempt < max_retries:
-                print(f"Analysis error, retrying... (Attempt {attempt + 1}/{max_retries})")
-                time.sleep(2)
-            else:
-                # Final attempt failed
-                return {
-                    "success": False,
-                    "returncode": -1,
-                    "stdout": "",
-                    "stderr": f"Analysis failed after {max_retries} retries: {str(e)}",
-                    "command": "unknown"
-                }
-
-    # If we get here, all retries failed
-    return {
-        "success": False,
-        "returncode": -1,
-        "stdout": "",
-        "stderr": f"Analysis failed after {max_retries} retries",
-        "command": "unknown"
-    }
+@functools.lru_cache(maxsize=1)
+def _parser():
+    """Build the CLI argument parser once per process"""
+    import argparse
 
-def main():
-    """Main function for CLI execution"""
     parser = argparse.ArgumentParser(description="Code Analysis CLI Wrapper")
     parser.add_argument(
         "action",
@@ -345,7 +669,11 @@ def main():
         help="Maximum retry attempts for execute-retry action (default: 2)"
     )
 
-    args = parser.parse_args()
+    return parser
+
+def main():
+    """Main function for CLI execution"""
+    args = _parser().parse_args()
 
     if args.action == "generate":
         # Generate and print command
@@ -353,17 +681,19 @@ def main():
         print(f"Generated command: {command}")
 
     elif args.action == "execute":
-        # Execute analysis (original behavior)
-        result = execute_analysis(args.scenario, args.target, args.context, args.timeout)
+        # Execute analysis (original behavior), showing results as they arrive
+        result = execute_analysis(args.scenario, args.target, args.context, args.timeout, stream=True)
 
         if result["success"]:
             print("✅ Analysis completed successfully!")
-            print("\nAnalysis Results:")
-            print("=" * 50)
-            print(result["stdout"])
         else:
             print("❌ Analysis failed!")
-            print(f"Error: {result['stderr']}")
+            if result["returncode"] == -1:
+                # Timeout or launch failure: the message never came from the tool
+                print(f"Error: {result['stderr']}")
+            else:
+                # The tool's own stderr was already shown live
+                print(f"Error: exited with status {result['returncode']} (see output above)")
             print(f"Command: {result['command']}")
 
     elif args.action == "execute-optimized":
@@ -4,9 +4,30 @@ Command handler for code-analyzer slash commands
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(__file__))
-from config_manager import ConfigManager
+
+try:
+    from .config_manager import ConfigManager
+except ImportError:
+    # Executed directly as a script: its directory is already on sys.path
+    from config_manager import ConfigManager
+
+_HELP_TEXT = """
+Code Analyzer Configuration Help
+================================
+
+Commands:
+  /code-analyzer:tool gemini    - Use Gemini CLI for analysis
+  /code-analyzer:tool qwen      - Use Qwen CLI for analysis (default)
+  /code-analyzer:status         - Show current configuration
+  /code-analyzer:help           - Show this help
+
+Default: Qwen CLI
+
+After configuration, use the code analyzer skill normally:
+  "Analyze authentication patterns in this codebase"
+  "Provide architectural overview of the application"
+  "Perform systematic code review"
+"""
 
 def handle_command(args):
     """
@@ -30,10 +51,9 @@ def handle_command(args):
             print(f"✓ Successfully set preferred tool to: {tool}")
 
             # Show updated status
-            status = config.get_status()
             print(f"\nCurrent configuration:")
-            print(f"  Preferred tool: {status['preferred_tool']}")
-            print(f"  Effective tool: {status['effective_tool']}")
+            print(f"  Preferred tool: {config.get_preferred_tool()}")
+            print(f"  Effective tool: {config.get_effective_tool()}")
 
         except ValueError as e:
             print(f"✗ Error: {e}")
@@ -42,32 +62,15 @@ def handle_command(args):
 
     elif command == "status":
         status = config.get_status()
-        print("Current Configuration:")
-        print(f"  Preferred tool: {status['preferred_tool']}")
-        print("  Available tools:")
+        lines = ["Current Configuration:", f"  Preferred tool: {status['preferred_tool']}", "  Available tools:"]
         for tool, info in status['available_tools'].items():
             status_icon = "✓" if info['available'] else "✗"
-            print(f"    {tool}: {status_icon} Available - Command: {info['command']}")
-        print(f"  Effective tool: {status['effective_tool']}")
+            lines.append(f"    {tool}: {status_icon} Available - Command: {info['command']}")
+        lines.append(f"  Effective tool: {status['effective_tool']}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     elif command == "help":
-        print("""
-Code Analyzer Configuration Help
-================================
-
-Commands:
-  /code-analyzer:tool gemini    - Use Gemini CLI for analysis
-  /code-analyzer:tool qwen      - Use Qwen CLI for analysis (default)
-  /code-analyzer:status         - Show current configuration
-  /code-analyzer:help           - Show this help
-
-Default: Qwen CLI
-
-After configuration, use the code analyzer skill normally:
-  "Analyze authentication patterns in this codebase"
-  "Provide architectural overview of the application"
-  "Perform systematic code review"
-""")
+        print(_HELP_TEXT)
     else:
         print(f"Unknown command: {command}")
         print("Use /code-analyzer:help for available commands")
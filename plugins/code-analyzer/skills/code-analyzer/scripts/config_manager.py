@@ -7,17 +7,38 @@ Handles tool selection through command-based configuration.
 
 import os
 import json
+import functools
 from pathlib import Path
 
+# Parsed config files: path -> (st_mtime_ns, config); a changed mtime means re-parse
+_CFG_CACHE = {}
+
+@functools.lru_cache(maxsize=16)
+def _which(name):
+    """
+    Cached shutil.which, so $PATH is walked at most once per tool per process.
+
+    Call _which.cache_clear() to pick up newly installed tools.
+    """
+    import shutil
+
+    return shutil.which(name)
+
 class ConfigManager:
     """
     Manages configuration for code analysis tools.
     """
 
     def __init__(self):
-        self.config_file = Path.home() / ".claude" / "code_analyzer_config.json"
         self.default_tool = "qwen"  # Default to Qwen
 
+    @functools.cached_property
+    def config_file(self):
+        """
+        Path of the configuration file, resolved on first use.
+        """
+        return Path.home() / ".claude" / "code_analyzer_config.json"
+
     def get_preferred_tool(self):
         """
         Get the preferred analysis tool from configuration.
@@ -26,14 +47,26 @@ class ConfigManager:
             str: Tool name (gemini, qwen)
         """
         # Check config file
-        if self.config_file.exists():
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
+            return self.default_tool
+
+        path = str(self.config_file)
+        cached = _CFG_CACHE.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            config = cached[1]
+        else:
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
-                    if "preferred_tool" in config and config["preferred_tool"] in ["gemini", "qwen"]:
-                        return config["preferred_tool"]
-            except (json.JSONDecodeError, KeyError, IOError) as e:
+            except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Failed to read configuration file: {e}")
+                return self.default_tool
+            _CFG_CACHE[path] = (st.st_mtime_ns, config)
+
+        if isinstance(config, dict) and config.get("preferred_tool") in ["gemini", "qwen"]:
+            return config["preferred_tool"]
 
         # Return default
         return self.default_tool
@@ -60,15 +93,28 @@ class ConfigManager:
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Failed to read existing configuration: {e}")
 
+        # Nothing to do if the tool is already recorded
+        if config.get("preferred_tool") == tool:
+            return
+
         # Update config
         config["preferred_tool"] = tool
 
-        # Save config
+        # Save config via a temporary file so a crash never leaves it truncated
+        tmp_file = self.config_file.with_suffix(".json.tmp")
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2, sort_keys=True)
+            os.replace(tmp_file, self.config_file)
         except IOError as e:
+            if tmp_file.exists():
+                tmp_file.unlink()
             raise IOError(f"Failed to save configuration: {e}")
+        finally:
+            # Drop cached parses of this file; mtime granularity can miss quick rewrites
+            _CFG_CACHE.pop(str(self.config_file), None)
+            # Re-resolve tools too, in case the newly selected one was just installed
+            _which.cache_clear()
 
     def detect_available_tools(self):
         """
@@ -77,19 +123,17 @@ class ConfigManager:
         Returns:
             dict: Available tools and their status
         """
-        import shutil
-
         available_tools = {}
 
         # Check for Gemini CLI
-        gemini_available = shutil.which("gemini") is not None or shutil.which("geminicli") is not None
+        gemini_available = _which("gemini") is not None or _which("geminicli") is not None
         available_tools["gemini"] = {
             "available": gemini_available,
-            "command": shutil.which("geminicli") or shutil.which("gemini") or "Not found"
+            "command": _which("geminicli") or _which("gemini") or "Not found"
         }
 
         # Check for Qwen CLI
-        qwen_command = shutil.which("qwen")
+        qwen_command = _which("qwen")
         available_tools["qwen"] = {
             "available": qwen_command is not None,
             "command": qwen_command or "Not found"
@@ -97,6 +141,30 @@ class ConfigManager:
 
         return available_tools
 
+    def is_tool_available(self, tool):
+        """
+        Check whether a single analysis tool is available in the system.
+
+        Args:
+            tool: Tool name (gemini, qwen)
+
+        Returns:
+            bool: True if the tool's command is on PATH
+        """
+        if tool == "gemini":
+            return _which("gemini") is not None or _which("geminicli") is not None
+        return _which(tool) is not None
+
+    def get_effective_tool(self):
+        """
+        Get the tool that will actually be used for analysis.
+
+        Returns:
+            str: Preferred tool name, or None if it is not available
+        """
+        preferred = self.get_preferred_tool()
+        return preferred if self.is_tool_available(preferred) else None
+
     def get_status(self):
         """
         Get current configuration status.
@@ -116,14 +184,23 @@ class ConfigManager:
             "effective_tool": effective_tool
         }
 
-def get_configuration_help():
+# Shared instance for module-level lookups; construction is cheap since
+# config_file is only resolved on first use
+_default_config = ConfigManager()
+
+def get_preferred_tool():
     """
-    Get help text for configuring the code analyzer.
+    Get the preferred analysis tool without building a ConfigManager per call.
+
+    Each call costs one os.stat of the config file; the parsed contents are
+    reused while its mtime is unchanged, so edits from other processes are seen.
 
     Returns:
-        str: Configuration help text
+        str: Tool name (gemini, qwen)
     """
-    return """
+    return _default_config.get_preferred_tool()
+
+_CONFIGURATION_HELP = """
 Code Analyzer Configuration
 ===========================
 
@@ -144,6 +221,15 @@ Available Tools:
 Note: The configured tool must be installed and available in your PATH.
 """
 
+def get_configuration_help():
+    """
+    Get help text for configuring the code analyzer.
+
+    Returns:
+        str: Configuration help text
+    """
+    return _CONFIGURATION_HELP
+
 if __name__ == "__main__":
     import sys
 
@@ -152,10 +238,11 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         if sys.argv[1] == "--check-availability":
             available = config.detect_available_tools()
-            print("Available tools:")
+            lines = ["Available tools:"]
             for tool, is_available in available.items():
                 status = "✓ Available" if is_available else "✗ Not available"
-                print(f"  {tool}: {status}")
+                lines.append(f"  {tool}: {status}")
+            sys.stdout.write("\n".join(lines) + "\n")
 
         elif sys.argv[1] == "--set-tool" and len(sys.argv) > 2:
             try:
@@ -170,12 +257,12 @@ if __name__ == "__main__":
 
         elif sys.argv[1] == "--status":
             status = config.get_status()
-            print(f"Preferred tool: {status['preferred_tool']}")
-            print("Available tools:")
+            lines = [f"Preferred tool: {status['preferred_tool']}", "Available tools:"]
             for tool, info in status['available_tools'].items():
                 status_icon = "✓" if info['available'] else "✗"
-                print(f"  {tool}: {status_icon} Available - Command: {info['command']}")
-            print(f"Effective tool: {status['effective_tool']}")
+                lines.append(f"  {tool}: {status_icon} Available - Command: {info['command']}")
+            lines.append(f"Effective tool: {status['effective_tool']}")
+            sys.stdout.write("\n".join(lines) + "\n")
 
         elif sys.argv[1] == "--help":
             print(get_configuration_help())
@@ -183,10 +270,9 @@ if __name__ == "__main__":
     else:
         # Show current configuration
         status = config.get_status()
-        print("Current Configuration:")
-        print(f"  Preferred tool: {status['preferred_tool']}")
-        print("  Available tools:")
+        lines = ["Current Configuration:", f"  Preferred tool: {status['preferred_tool']}", "  Available tools:"]
         for tool, info in status['available_tools'].items():
             status_icon = "✓" if info['available'] else "✗"
-            print(f"    {tool}: {status_icon} Available - Command: {info['command']}")
-        print(f"  Effective tool: {status['effective_tool']}")
\ No newline at end of file
+            lines.append(f"    {tool}: {status_icon} Available - Command: {info['command']}")
+        lines.append(f"  Effective tool: {status['effective_tool']}")
+        sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file